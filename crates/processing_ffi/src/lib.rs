@@ -2108,6 +2108,20 @@ pub extern "C" fn processing_geometry_set_uv(geo_id: u64, index: u32, u: f32, v:
     error::check(|| geometry_set_uv(entity, index, Vec2::new(u, v)));
 }
 
+/// # Safety
+/// - `indices` must be valid for reads of `len` elements.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn processing_geometry_set_indices(
+    geo_id: u64,
+    indices: *const u32,
+    len: u32,
+) {
+    error::clear_error();
+    let entity = Entity::from_bits(geo_id);
+    let indices = unsafe { std::slice::from_raw_parts(indices, len as usize) }.to_vec();
+    error::check(|| geometry_set_indices(entity, indices));
+}
+
 #[unsafe(no_mangle)]
 pub extern "C" fn processing_geometry_destroy(geo_id: u64) {
     error::clear_error();
@@ -238,7 +238,21 @@ impl GlfwContext {
 
     pub fn poll_events(&mut self) -> bool {
         self.glfw.poll_events();
+        self.process_events()
+    }
+
+    /// Blocks until an event arrives or `timeout` seconds have passed without processing
+    /// anything; follow it with [`Self::poll_events`]. It doesn't borrow the context, so
+    /// callers can release their own locks (e.g. the GIL) around the wait.
+    ///
+    /// # Safety
+    /// - A `GlfwContext` is alive for the whole call.
+    /// - This is called from the thread that created that context.
+    pub unsafe fn block_until_event(timeout: f64) {
+        unsafe { glfw::ffi::glfwWaitEventsTimeout(timeout) }
+    }
 
+    fn process_events(&mut self) -> bool {
         let surface = match self.surface {
             Some(s) => s,
             None => {
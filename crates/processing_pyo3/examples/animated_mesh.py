@@ -1,59 +1,60 @@
 from mewnala import *
-from math import sin, cos
+import numpy as np
 
 geometry = None
 grid_size = 20 
 spacing = 10.0
 offset = (grid_size * spacing) / 2.0
 time = 0.0
+px = None
+pz = None
 
 def setup():
-    global geometry
+    global geometry, px, pz
     size(800, 600)
     mode_3d()
     geometry = Geometry()
-    for z in range(grid_size):
-        for x in range(grid_size):
-            px = x * spacing - offset
-            pz = z * spacing - offset
-            geometry.color(x/grid_size, 0.5, z/grid_size, 1.0)
-            geometry.normal(0.0, 1.0, 0.0)
-            geometry.vertex(px, 0.0, pz)
-
-    for z in range(grid_size-1):
-        for x in range(grid_size-1):
-            tl = z * grid_size + x
-            tr = tl + 1
-            bl = (z + 1) * grid_size + x
-            br = bl + 1
-
-            geometry.index(tl)
-            geometry.index(bl)
-            geometry.index(tr)
-
-            geometry.index(tr)
-            geometry.index(bl)
-            geometry.index(br)
+
+    xs, zs = np.meshgrid(np.arange(grid_size), np.arange(grid_size))
+    xs, zs = xs.ravel(), zs.ravel()
+    count = grid_size * grid_size
+
+    positions = np.zeros((count, 3), dtype=np.float32)
+    positions[:, 0] = xs * spacing - offset
+    positions[:, 2] = zs * spacing - offset
+
+    colors = np.ones((count, 4), dtype=np.float32)
+    colors[:, 0] = xs / grid_size
+    colors[:, 1] = 0.5
+    colors[:, 2] = zs / grid_size
+
+    normals = np.tile(np.array([0.0, 1.0, 0.0], dtype=np.float32), (count, 1))
+
+    px = positions[:, 0].copy()
+    pz = positions[:, 2].copy()
+
+    geometry.vertices_from_array(positions)
+    geometry.colors_from_array(colors)
+    geometry.normals_from_array(normals)
+
+    cz, cx = np.mgrid[:grid_size - 1, :grid_size - 1]
+    tl = cz * grid_size + cx
+    tr = tl + 1
+    bl = tl + grid_size
+    br = bl + 1
+    indices = np.stack([tl, bl, tr, tr, bl, br], axis=-1).ravel().astype(np.uint32)
+    geometry.indices_from_array(indices)
 
 
 def draw():
-    global geometry
-    global grid_size
-    global offset
-    global spacing
     global time
 
     camera_position(150.0, 150.0, 150.0)
     camera_look_at( 0.0, 0.0, 0.0)
     background(220, 200, 140)
 
-    for z in range(grid_size):
-        for x in range(grid_size):
-            idx = int(z * grid_size + x)
-            px = x * spacing - offset
-            pz = z * spacing - offset
-            wave = sin(px * 0.1 + time) * cos(pz * 0.1 + time) * 20.0
-            geometry.set_vertex(idx, px, wave, pz)
+    wave = np.sin(px * 0.1 + time) * np.cos(pz * 0.1 + time) * 20.0
+    geometry.set_vertices_y(wave.astype(np.float32))
 
     draw_geometry(geometry)
 
@@ -0,0 +1,83 @@
+from mewnala import *
+import math
+import numpy as np
+from numba import njit, prange
+
+# same wave as animated_mesh.py, on a grid large enough that the per-frame
+# height computation dominates. the kernel is compiled once by numba and
+# cached on disk, so only the first ever run pays the compile cost.
+#
+# numba lives in its own dependency group:
+#   uv run --group numba python ./examples/animated_mesh_numba.py
+
+geometry = None
+grid_size = 200
+spacing = 1.0
+offset = (grid_size * spacing) / 2.0
+time = 0.0
+px = None
+pz = None
+ys = None
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def wave(px, pz, t, out):
+    for i in prange(px.shape[0]):
+        out[i] = math.sin(px[i] * 0.1 + t) * math.cos(pz[i] * 0.1 + t) * 20.0
+
+
+def setup():
+    global geometry, px, pz, ys
+    size(800, 600)
+    mode_3d()
+    geometry = Geometry()
+
+    xs, zs = np.meshgrid(np.arange(grid_size), np.arange(grid_size))
+    xs, zs = xs.ravel(), zs.ravel()
+    count = grid_size * grid_size
+
+    positions = np.zeros((count, 3), dtype=np.float32)
+    positions[:, 0] = xs * spacing - offset
+    positions[:, 2] = zs * spacing - offset
+
+    colors = np.ones((count, 4), dtype=np.float32)
+    colors[:, 0] = xs / grid_size
+    colors[:, 1] = 0.5
+    colors[:, 2] = zs / grid_size
+
+    normals = np.tile(np.array([0.0, 1.0, 0.0], dtype=np.float32), (count, 1))
+
+    px = positions[:, 0].copy()
+    pz = positions[:, 2].copy()
+    ys = np.empty(count, dtype=np.float32)
+
+    geometry.vertices_from_array(positions)
+    geometry.colors_from_array(colors)
+    geometry.normals_from_array(normals)
+
+    cz, cx = np.mgrid[:grid_size - 1, :grid_size - 1]
+    tl = cz * grid_size + cx
+    tr = tl + 1
+    bl = tl + grid_size
+    br = bl + 1
+    indices = np.stack([tl, bl, tr, tr, bl, br], axis=-1).ravel().astype(np.uint32)
+    geometry.indices_from_array(indices)
+
+
+def draw():
+    global time
+
+    camera_position(150.0, 150.0, 150.0)
+    camera_look_at(0.0, 0.0, 0.0)
+    background(220, 200, 140)
+
+    wave(px, pz, np.float32(time), ys)
+    geometry.set_vertices_y(ys)
+
+    draw_geometry(geometry)
+
+    time += 0.05
+
+
+# TODO: this should happen implicitly on module load somehow
+run()
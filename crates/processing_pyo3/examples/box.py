@@ -5,6 +5,7 @@ angle = 0.0
 def setup():
     size(800, 600)
     mode_3d()
+    frame_rate(30)
 
 def draw():
     global angle
@@ -17,7 +18,8 @@ def draw():
     box(100.0, 100.0, 100.0)
     pop_matrix()
 
-    angle += 0.02
+    # scale by delta_time so the spin speed doesn't depend on frame_rate()
+    angle += 1.2 * delta_time
 
 
 # TODO: this should happen implicitly on module load somehow
@@ -145,15 +145,19 @@ class Boid:
         desired_separation = 25.0
         steer = Vec2(0, 0)
         count = 0
+        # Bind the lookups this loop repeats for every other boid to locals once
+        position = self.position
+        dist = position.dist
+        add = steer.add
         # For every boid in the system, check if it's too close
         for other in boids:
-            d = self.position.dist(other.position)
+            d = dist(other.position)
             # If the distance is greater than 0 and less than an arbitrary amount (0 when you are yourself)
             if 0 < d < desired_separation:
                 # Calculate vector pointing away from neighbor
-                diff = (self.position - other.position).normalize()
+                diff = (position - other.position).normalize()
                 diff.div(d)  # Weight by distance
-                steer.add(diff)
+                add(diff)
                 count += 1  # Keep track of how many
         # Average -- divide by how many
         if count > 0:
@@ -173,10 +177,12 @@ class Boid:
         neighbor_dist = 50.0
         sum = Vec2(0, 0)
         count = 0
+        dist = self.position.dist
+        add = sum.add
         for other in boids:
-            d = self.position.dist(other.position)
+            d = dist(other.position)
             if 0 < d < neighbor_dist:
-                sum.add(other.velocity)
+                add(other.velocity)
                 count += 1
         if count > 0:
             sum.div(count)
@@ -194,10 +200,12 @@ class Boid:
         neighbor_dist = 50.0
         sum = Vec2(0, 0)  # Start with empty vector to accumulate all positions
         count = 0
+        dist = self.position.dist
+        add = sum.add
         for other in boids:
-            d = self.position.dist(other.position)
+            d = dist(other.position)
             if 0 < d < neighbor_dist:
-                sum.add(other.position)  # Add position
+                add(other.position)  # Add position
                 count += 1
         if count > 0:
             sum.div(count)
@@ -0,0 +1,55 @@
+from mewnala import *
+import numpy as np
+
+# draws a field of spinning boxes with a single draw_instanced call. each row
+# of `transforms` is a column-major 4x4 matrix, so the translation lives in
+# elements 12..15.
+
+count = 32
+spacing = 20.0
+cube = None
+positions = None
+phases = None
+angle = 0.0
+
+
+def setup():
+    global cube, positions, phases
+    size(800, 600)
+    mode_3d()
+
+    cube = Geometry.box(10.0, 10.0, 10.0)
+
+    xs, zs = np.meshgrid(np.arange(count), np.arange(count))
+    offset = (count - 1) * spacing / 2.0
+    positions = np.zeros((count * count, 3), dtype=np.float32)
+    positions[:, 0] = xs.ravel() * spacing - offset
+    positions[:, 2] = zs.ravel() * spacing - offset
+    phases = (xs + zs).ravel().astype(np.float32) * 0.2
+
+
+def draw():
+    global angle
+    camera_position(300.0, 300.0, 500.0)
+    camera_look_at(0.0, 0.0, 0.0)
+    background(220)
+
+    theta = phases + angle
+    c, s = np.cos(theta), np.sin(theta)
+
+    mats = np.zeros((count * count, 4, 4), dtype=np.float32)
+    mats[:, 0, 0] = c
+    mats[:, 0, 2] = -s
+    mats[:, 1, 1] = 1.0
+    mats[:, 2, 0] = s
+    mats[:, 2, 2] = c
+    mats[:, 3, :3] = positions
+    mats[:, 3, 3] = 1.0
+
+    draw_instanced(cube, mats.reshape(-1, 16))
+
+    angle += 0.02
+
+
+# TODO: this should happen implicitly on module load somehow
+run()
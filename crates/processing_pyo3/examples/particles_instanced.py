@@ -0,0 +1,51 @@
+from mewnala import *
+import numpy as np
+
+# a gaussian cloud of spheres kept in a numpy ring buffer: each frame the
+# oldest `respawn` particles are replaced with fresh samples, everything
+# drifts upward, and the whole cloud is drawn with one draw_instanced call.
+
+count = 2000
+respawn = 20
+center = np.array([0.0, -100.0, 0.0], dtype=np.float32)
+spread = np.array([80.0, 20.0, 80.0], dtype=np.float32)
+
+rng = np.random.default_rng()
+sphere = None
+positions = None
+mats = None
+cursor = 0
+
+
+def setup():
+    global sphere, positions, mats
+    size(800, 600)
+    mode_3d()
+
+    sphere = Geometry.sphere(2.0, 8, 6)
+    positions = rng.normal(center, spread, size=(count, 3)).astype(np.float32)
+    positions[:, 1] += rng.uniform(0.0, 250.0, size=count).astype(np.float32)
+
+    # identity matrices; only the translation row is rewritten each frame
+    mats = np.tile(np.eye(4, dtype=np.float32), (count, 1, 1))
+
+
+def draw():
+    global cursor
+    camera_position(0.0, 100.0, 400.0)
+    camera_look_at(0.0, 0.0, 0.0)
+    background(20)
+
+    ring = (cursor + np.arange(respawn)) % count
+    positions[ring] = rng.normal(center, spread, size=(respawn, 3))
+    cursor = (cursor + respawn) % count
+
+    positions[:, 1] += 1.0
+
+    mats[:, 3, :3] = positions
+    fill(255, 180, 80)
+    draw_instanced(sphere, mats.reshape(-1, 16))
+
+
+# TODO: this should happen implicitly on module load somehow
+run()
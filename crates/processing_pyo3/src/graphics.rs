@@ -4,16 +4,19 @@ use crate::input;
 use crate::math::{extract_vec2, extract_vec3, extract_vec4};
 use bevy::{
     color::{ColorToPacked, Srgba},
-    math::Vec4,
+    math::{Mat4, Vec4},
     prelude::Entity,
     render::render_resource::{Extent3d, TextureFormat},
 };
 use processing::prelude::*;
 use pyo3::{
-    exceptions::PyRuntimeError,
+    buffer::{Element, PyBuffer},
+    exceptions::{PyRuntimeError, PyValueError},
     prelude::*,
     types::{PyDict, PyTuple},
 };
+use std::cell::RefCell;
+use std::hash::{DefaultHasher, Hash, Hasher};
 
 #[cfg(feature = "cuda")]
 use crate::cuda::CudaImage;
@@ -52,6 +55,50 @@ fn cuda_import_from_interface(
         .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
 }
 
+/// copy a numpy array, memoryview or other buffer-protocol object of `T` out with a single
+/// memcpy; `None` when `obj` doesn't expose a buffer of that element type.
+fn buffer_to_vec<T: Element>(obj: &Bound<'_, PyAny>) -> Option<PyResult<Vec<T>>> {
+    let buffer = PyBuffer::<T>::get(obj).ok()?;
+    Some(buffer.to_vec(obj.py()))
+}
+
+/// flat `f32`s from a buffer when possible, falling back to any sequence of floats.
+fn extract_f32s(obj: &Bound<'_, PyAny>) -> PyResult<Vec<f32>> {
+    match buffer_to_vec(obj) {
+        Some(values) => values,
+        None => Ok(obj.extract()?),
+    }
+}
+
+/// flat `u32`s from a buffer when possible, falling back to any sequence of ints.
+fn extract_u32s(obj: &Bound<'_, PyAny>) -> PyResult<Vec<u32>> {
+    match buffer_to_vec(obj) {
+        Some(values) => values,
+        None => Ok(obj.extract()?),
+    }
+}
+
+/// rows of `N` floats, e.g. an `(n, 3)` float32 array of positions. buffers must be shaped
+/// `(n, ...)` with trailing dimensions holding exactly `N` values, like `(n, 16)` or
+/// `(n, 4, 4)` for matrices; anything else goes through sequence extraction.
+fn extract_f32_rows<const N: usize>(obj: &Bound<'_, PyAny>) -> PyResult<Vec<[f32; N]>> {
+    let Ok(buffer) = PyBuffer::<f32>::get(obj) else {
+        return Ok(obj.extract()?);
+    };
+    let shape = buffer.shape();
+    if shape.len() < 2 || shape[1..].iter().product::<usize>() != N {
+        return Err(PyValueError::new_err(format!(
+            "expected an array of shape (n, {N}), got {shape:?}"
+        )));
+    }
+    // to_vec copies in C order, so Fortran-ordered and strided arrays come out row by row
+    let values = buffer.to_vec(obj.py())?;
+    Ok(values
+        .chunks_exact(N)
+        .map(|row| row.try_into().unwrap())
+        .collect())
+}
+
 #[pyclass(name = "BlendMode", from_py_object)]
 #[derive(Clone)]
 pub struct PyBlendMode {
@@ -435,6 +482,44 @@ impl Geometry {
         geometry_set_vertex(self.entity, i, v).map_err(|e| PyRuntimeError::new_err(format!("{e}")))
     }
 
+    /// replace all vertex positions from an `(N, 3)` array-like in one call; other
+    /// attributes are resized to `N` using the current normal/color/uv.
+    pub fn vertices_from_array(&self, positions: &Bound<'_, PyAny>) -> PyResult<()> {
+        geometry_set_vertices(self.entity, extract_f32_rows(positions)?)
+            .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
+    }
+
+    /// overwrite only the Y component of every vertex from a flat array-like of
+    /// length `vertex_count()`, e.g. a height field computed with numpy.
+    pub fn set_vertices_y(&self, ys: &Bound<'_, PyAny>) -> PyResult<()> {
+        geometry_set_vertices_y(self.entity, extract_f32s(ys)?)
+            .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
+    }
+
+    /// replace all vertex normals from an `(N, 3)` array-like.
+    pub fn normals_from_array(&self, normals: &Bound<'_, PyAny>) -> PyResult<()> {
+        geometry_set_normals(self.entity, extract_f32_rows(normals)?)
+            .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
+    }
+
+    /// replace all vertex colors from an `(N, 4)` array-like of RGBA floats.
+    pub fn colors_from_array(&self, colors: &Bound<'_, PyAny>) -> PyResult<()> {
+        geometry_set_colors(self.entity, extract_f32_rows(colors)?)
+            .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
+    }
+
+    /// replace all texture coordinates from an `(N, 2)` array-like.
+    pub fn uvs_from_array(&self, uvs: &Bound<'_, PyAny>) -> PyResult<()> {
+        geometry_set_uvs(self.entity, extract_f32_rows(uvs)?)
+            .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
+    }
+
+    /// replace the index buffer from a flat array-like of vertex indices.
+    pub fn indices_from_array(&self, indices: &Bound<'_, PyAny>) -> PyResult<()> {
+        geometry_set_indices(self.entity, extract_u32s(indices)?)
+            .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
+    }
+
     pub fn vertex_count(&self) -> PyResult<u32> {
         geometry_vertex_count(self.entity).map_err(|e| PyRuntimeError::new_err(format!("{e}")))
     }
@@ -473,6 +558,8 @@ pub struct Graphics {
     pub width: u32,
     #[pyo3(get)]
     pub height: u32,
+    /// hash of the pixels last encoded by `readback_png_cached`, with the encoded PNG
+    last_readback: RefCell<Option<(u64, Vec<u8>)>>,
 }
 
 impl Drop for Graphics {
@@ -521,6 +608,7 @@ impl Graphics {
             surface,
             width,
             height,
+            last_readback: RefCell::new(None),
         })
     }
 
@@ -558,6 +646,7 @@ impl Graphics {
             surface,
             width,
             height,
+            last_readback: RefCell::new(None),
         })
     }
 
@@ -582,38 +671,8 @@ impl Graphics {
     }
 
     pub fn readback_png(&self) -> PyResult<Vec<u8>> {
-        let raw = graphics_readback_raw(self.entity)
-            .map_err(|e| PyRuntimeError::new_err(format!("{e}")))?;
-
-        // png-ify our raw data, for srgb formats we're already good
-        let rgba_bytes = match raw.format {
-            TextureFormat::Rgba8UnormSrgb => raw.bytes,
-            _ => {
-                let pixels = graphics_readback(self.entity)
-                    .map_err(|e| PyRuntimeError::new_err(format!("{e}")))?;
-                pixels
-                    .iter()
-                    .flat_map(|pixel| Srgba::from(*pixel).to_u8_array())
-                    .collect()
-            }
-        };
-
-        let mut png_buf: Vec<u8> = Vec::new();
-        {
-            let mut encoder = png::Encoder::new(&mut png_buf, raw.width, raw.height);
-            // todo: infer these from the texture format instead of hardcoding
-            encoder.set_color(png::ColorType::Rgba);
-            encoder.set_depth(png::BitDepth::Eight);
-            encoder.set_source_srgb(png::SrgbRenderingIntent::Perceptual);
-            let mut writer = encoder
-                .write_header()
-                .map_err(|e| PyRuntimeError::new_err(format!("PNG header: {e}")))?;
-            writer
-                .write_image_data(&rgba_bytes)
-                .map_err(|e| PyRuntimeError::new_err(format!("PNG write: {e}")))?;
-        }
-
-        Ok(png_buf)
+        let (width, height, rgba_bytes) = self.readback_rgba()?;
+        encode_png(width, height, &rgba_bytes)
     }
 
     pub fn poll_for_sketch_update(&self) -> PyResult<Sketch> {
@@ -1532,6 +1591,30 @@ impl Graphics {
             .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
     }
 
+    /// draw `geometry` once per transform. `transforms` is an `(N, 16)` or `(N, 4, 4)`
+    /// array-like of column-major 4x4 matrices applied on top of the current matrix; all instances
+    /// share one mesh and material and render as a single instanced draw. only affine
+    /// translate/rotate/scale matrices are supported (shear and projection are dropped),
+    /// and each instance is still set up on the CPU every frame, so cost grows with `N`.
+    pub fn draw_instanced(
+        &self,
+        geometry: &Geometry,
+        transforms: &Bound<'_, PyAny>,
+    ) -> PyResult<()> {
+        let transforms = extract_f32_rows::<16>(transforms)?
+            .iter()
+            .map(Mat4::from_cols_array)
+            .collect();
+        graphics_record_command(
+            self.entity,
+            DrawCommand::GeometryInstanced {
+                geometry: geometry.entity,
+                transforms,
+            },
+        )
+        .map_err(|e| PyRuntimeError::new_err(format!("{e}")))
+    }
+
     pub fn particles(
         &self,
         particles: &crate::particles::Particles,
@@ -1841,6 +1924,66 @@ impl Graphics {
     }
 }
 
+impl Graphics {
+    fn readback_rgba(&self) -> PyResult<(u32, u32, Vec<u8>)> {
+        let raw = graphics_readback_raw(self.entity)
+            .map_err(|e| PyRuntimeError::new_err(format!("{e}")))?;
+
+        // png-ify our raw data, for srgb formats we're already good
+        let rgba_bytes = match raw.format {
+            TextureFormat::Rgba8UnormSrgb => raw.bytes,
+            _ => {
+                let pixels = graphics_readback(self.entity)
+                    .map_err(|e| PyRuntimeError::new_err(format!("{e}")))?;
+                pixels
+                    .iter()
+                    .flat_map(|pixel| Srgba::from(*pixel).to_u8_array())
+                    .collect()
+            }
+        };
+
+        Ok((raw.width, raw.height, rgba_bytes))
+    }
+
+    /// Like `readback_png`, but hands back the previous PNG without re-encoding when the
+    /// pixels are identical to the last successful encode.
+    pub(crate) fn readback_png_cached(&self) -> PyResult<Vec<u8>> {
+        let (width, height, rgba_bytes) = self.readback_rgba()?;
+        let mut hasher = DefaultHasher::new();
+        (width, height).hash(&mut hasher);
+        rgba_bytes.hash(&mut hasher);
+        let hash = hasher.finish();
+
+        if let Some((last_hash, png)) = &*self.last_readback.borrow()
+            && *last_hash == hash
+        {
+            return Ok(png.clone());
+        }
+        let png = encode_png(width, height, &rgba_bytes)?;
+        self.last_readback.replace(Some((hash, png.clone())));
+        Ok(png)
+    }
+}
+
+fn encode_png(width: u32, height: u32, rgba_bytes: &[u8]) -> PyResult<Vec<u8>> {
+    let mut png_buf: Vec<u8> = Vec::new();
+    {
+        let mut encoder = png::Encoder::new(&mut png_buf, width, height);
+        // todo: infer these from the texture format instead of hardcoding
+        encoder.set_color(png::ColorType::Rgba);
+        encoder.set_depth(png::BitDepth::Eight);
+        encoder.set_source_srgb(png::SrgbRenderingIntent::Perceptual);
+        let mut writer = encoder
+            .write_header()
+            .map_err(|e| PyRuntimeError::new_err(format!("PNG header: {e}")))?;
+        writer
+            .write_image_data(rgba_bytes)
+            .map_err(|e| PyRuntimeError::new_err(format!("PNG write: {e}")))?;
+    }
+
+    Ok(png_buf)
+}
+
 #[cfg(feature = "cuda")]
 #[pymethods]
 impl Graphics {
@@ -36,7 +36,7 @@ use material::Material;
 
 use pyo3::{
     BoundObject,
-    exceptions::PyRuntimeError,
+    exceptions::{PyRuntimeError, PyValueError},
     prelude::*,
     types::{PyDict, PyTuple},
 };
@@ -44,15 +44,20 @@ use shader::Shader;
 use std::ffi::{CStr, CString};
 
 use bevy::log::warn;
+use glfw::GlfwContext;
 use gltf::Gltf;
 use std::cell::{Cell, RefCell};
 use std::collections::HashMap;
 use std::env;
+use std::time::{Duration, Instant};
 
 #[derive(Clone, Copy)]
 struct LoopState {
     looping: bool,
     redraw_requested: bool,
+    /// minimum time between frames set by `frame_rate()`; `None` runs as fast as
+    /// presentation allows.
+    frame_interval: Option<Duration>,
 }
 
 impl Default for LoopState {
@@ -60,10 +65,45 @@ impl Default for LoopState {
         Self {
             looping: true,
             redraw_requested: false,
+            frame_interval: None,
         }
     }
 }
 
+/// Time to wait between iterations of an idle event loop.
+fn idle_interval() -> Duration {
+    LOOP_STATE
+        .with(|s| s.get().frame_interval)
+        .unwrap_or(Duration::from_millis(16))
+}
+
+/// Blocks until a window event arrives or `timeout` passes, then processes what arrived.
+/// The GIL is released and the graphics object isn't borrowed while blocked, so other Python
+/// threads keep running. Returns `false` once the window has been closed.
+fn wait_for_events(module: &Bound<'_, PyModule>, timeout: Duration) -> PyResult<bool> {
+    // hold a strong reference (but no borrow) so another thread can't drop the window while
+    // the GIL is released
+    let window: Option<Py<Graphics>> = get_graphics(module)?
+        .filter(|g| g.surface.glfw_ctx.is_some())
+        .map(Py::from);
+    let has_window = window.is_some();
+    module.py().detach(|| {
+        if has_window {
+            // SAFETY: `window` keeps a Graphics that owns a live GlfwContext alive for the
+            // whole wait (the context is never removed once created), and Graphics is an
+            // unsendable pyclass, so we are on the thread that created it. detach runs the
+            // closure on this same thread.
+            unsafe { GlfwContext::block_until_event(timeout.as_secs_f64()) };
+        } else {
+            std::thread::sleep(timeout);
+        }
+    });
+    let Some(mut graphics) = get_graphics_mut(module)? else {
+        return Ok(true);
+    };
+    Ok(graphics.surface.poll_events())
+}
+
 thread_local! {
     static LAST_GLOBALS: RefCell<HashMap<&'static str, Py<PyAny>>> = RefCell::new(HashMap::new());
     static LOOP_STATE: Cell<LoopState> = Cell::new(LoopState::default());
@@ -796,6 +836,14 @@ mod mewnala {
         Ok(graphics.surface.poll_events())
     }
 
+    #[pyfunction]
+    #[pyo3(pass_module)]
+    fn _wait_events(module: &Bound<'_, PyModule>, timeout: f64) -> PyResult<bool> {
+        let timeout = Duration::try_from_secs_f64(timeout)
+            .map_err(|e| PyValueError::new_err(format!("invalid timeout {timeout}: {e}")))?;
+        wait_for_events(module, timeout)
+    }
+
     #[pyfunction]
     #[pyo3(pass_module)]
     fn _begin_draw(module: &Bound<'_, PyModule>) -> PyResult<()> {
@@ -820,7 +868,7 @@ mod mewnala {
         let Some(graphics) = get_graphics(module)? else {
             return Ok(None);
         };
-        graphics.readback_png().map(Some)
+        graphics.readback_png_cached().map(Some)
     }
 
     #[pyfunction]
@@ -882,6 +930,21 @@ mod mewnala {
         Ok(())
     }
 
+    /// cap the sketch at `fps` frames per second. frames are only drawn when looping or
+    /// after `redraw()`, so a static sketch should use `no_loop()` instead.
+    #[pyfunction]
+    fn frame_rate(fps: f32) -> PyResult<()> {
+        if !(fps > 0.0 && fps.is_finite()) {
+            return Err(PyValueError::new_err(format!(
+                "frame rate must be positive, got {fps}"
+            )));
+        }
+        let interval = Duration::try_from_secs_f32(1.0 / fps)
+            .map_err(|e| PyValueError::new_err(format!("frame rate {fps} is too low: {e}")))?;
+        update_loop_state(|s| s.frame_interval = Some(interval));
+        Ok(())
+    }
+
     #[pyfunction]
     #[pyo3(pass_module)]
     fn window_title(module: &Bound<'_, PyModule>, title: &str) -> PyResult<()> {
@@ -1082,15 +1145,10 @@ mod mewnala {
                     .end_draw()?;
 
                 loop {
-                    {
-                        let mut graphics = get_graphics_mut(module)?
-                            .ok_or_else(|| PyRuntimeError::new_err("call size() first"))?;
-                        if !graphics.surface.poll_events() {
-                            break;
-                        }
+                    if !wait_for_events(module, idle_interval())? {
+                        break;
                     }
                     dispatch_event_callbacks(&locals)?;
-                    std::thread::sleep(std::time::Duration::from_millis(16));
                 }
 
                 return Ok(());
@@ -1140,10 +1198,14 @@ mod mewnala {
                     });
 
                 if !should_draw {
-                    std::thread::sleep(std::time::Duration::from_millis(16));
+                    // no_loop(): block on window events until redraw() or input arrives
+                    if !wait_for_events(module, idle_interval())? {
+                        break;
+                    }
                     continue;
                 }
                 first_frame = false;
+                let frame_start = Instant::now();
 
                 get_graphics_mut(module)?
                     .ok_or_else(|| PyRuntimeError::new_err("call size() first"))?
@@ -1163,6 +1225,14 @@ mod mewnala {
                     .end_draw()?;
 
                 update_loop_state(|s| s.redraw_requested = false);
+
+                if let Some(rest) = LOOP_STATE
+                    .with(|s| s.get().frame_interval)
+                    .and_then(|interval| interval.checked_sub(frame_start.elapsed()))
+                {
+                    // release the GIL so other Python threads can run while we wait
+                    py.detach(|| std::thread::sleep(rest));
+                }
             }
 
             Ok(())
@@ -1330,6 +1400,16 @@ mod mewnala {
         graphics!(module).draw_geometry(&*geometry.extract::<PyRef<Geometry>>()?)
     }
 
+    #[pyfunction]
+    #[pyo3(pass_module, signature = (geometry, transforms))]
+    fn draw_instanced(
+        module: &Bound<'_, PyModule>,
+        geometry: &Bound<'_, Geometry>,
+        transforms: &Bound<'_, PyAny>,
+    ) -> PyResult<()> {
+        graphics!(module).draw_instanced(&*geometry.extract::<PyRef<Geometry>>()?, transforms)
+    }
+
     #[pyfunction]
     #[pyo3(pass_module, signature = (particles, geometry))]
     fn particles(
@@ -1,18 +1,21 @@
 import mewnala
-import time
 import traceback
 from IPython.terminal.pt_inputhooks import register
 
+# input_is_ready() is only checked between waits, so keep them short enough
+# that typing at the prompt stays responsive regardless of frame_rate()
+_WAIT_TIMEOUT = 1 / 60
+
+
 def _processing_inputhook(context):
     while not context.input_is_ready():
-        if not mewnala._poll_events():
+        if not mewnala._wait_events(_WAIT_TIMEOUT):
             mewnala._graphics = None
             break
         try:
             mewnala._tick(get_ipython().user_ns)
         except Exception:
             traceback.print_exc()
-        time.sleep(1.0 / 60.0)
 
 register('processing', _processing_inputhook)
 get_ipython().enable_gui('processing')
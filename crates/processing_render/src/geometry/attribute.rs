@@ -90,6 +90,13 @@ macro_rules! impl_setter {
             geometries: Query<&Geometry>,
             mut meshes: ResMut<Assets<Mesh>>,
         ) -> Result<()> {
+            // writing an unchanged value would still mark the mesh modified and re-upload it
+            if let Some(VertexAttributeValues::$variant(data)) =
+                get_mesh(entity, &geometries, &meshes)?.attribute($attr)
+                && data.get(index as usize) == Some(&value.to_array())
+            {
+                return Ok(());
+            }
             let mut mesh = get_mesh_mut(entity, &geometries, &mut meshes)?;
             match mesh.attribute_mut($attr) {
                 Some(VertexAttributeValues::$variant(data)) => {
@@ -121,6 +128,88 @@ impl_setter!(set_normal, Mesh::ATTRIBUTE_NORMAL, Float32x3, Vec3);
 impl_setter!(set_color, Mesh::ATTRIBUTE_COLOR, Float32x4, Vec4);
 impl_setter!(set_uv, Mesh::ATTRIBUTE_UV_0, Float32x2, Vec2);
 
+macro_rules! impl_bulk_setter {
+    ($name:ident, $attr:expr, $variant:ident, $type:ty) => {
+        pub fn $name(
+            In((entity, values)): In<(Entity, Vec<$type>)>,
+            geometries: Query<&Geometry>,
+            mut meshes: ResMut<Assets<Mesh>>,
+        ) -> Result<()> {
+            if let Some(VertexAttributeValues::$variant(data)) =
+                get_mesh(entity, &geometries, &meshes)?.attribute($attr)
+                && *data == values
+            {
+                return Ok(());
+            }
+            let mut mesh = get_mesh_mut(entity, &geometries, &mut meshes)?;
+            let count = match mesh.attribute(Mesh::ATTRIBUTE_POSITION) {
+                Some(positions) => positions.len(),
+                None => 0,
+            };
+            if values.len() != count {
+                return Err(ProcessingError::InvalidArgument(format!(
+                    "Expected {} values, got {}",
+                    count,
+                    values.len()
+                )));
+            }
+            match mesh.attribute_mut($attr) {
+                Some(VertexAttributeValues::$variant(data)) => {
+                    *data = values;
+                    Ok(())
+                }
+                Some(_) => Err(ProcessingError::InvalidArgument(
+                    concat!("Unexpected ", stringify!($name), " format").into(),
+                )),
+                None => Err(ProcessingError::InvalidArgument(
+                    concat!("Geometry missing ", stringify!($attr)).into(),
+                )),
+            }
+        }
+    };
+}
+
+impl_bulk_setter!(set_normals, Mesh::ATTRIBUTE_NORMAL, Float32x3, [f32; 3]);
+impl_bulk_setter!(set_colors, Mesh::ATTRIBUTE_COLOR, Float32x4, [f32; 4]);
+impl_bulk_setter!(set_uvs, Mesh::ATTRIBUTE_UV_0, Float32x2, [f32; 2]);
+
+/// Overwrites only the Y component of every vertex position, leaving X and Z untouched.
+pub fn set_vertices_y(
+    In((entity, ys)): In<(Entity, Vec<f32>)>,
+    geometries: Query<&Geometry>,
+    mut meshes: ResMut<Assets<Mesh>>,
+) -> Result<()> {
+    if let Some(VertexAttributeValues::Float32x3(data)) =
+        get_mesh(entity, &geometries, &meshes)?.attribute(Mesh::ATTRIBUTE_POSITION)
+    {
+        if ys.len() != data.len() {
+            return Err(ProcessingError::InvalidArgument(format!(
+                "Expected {} values, got {}",
+                data.len(),
+                ys.len()
+            )));
+        }
+        if data.iter().zip(&ys).all(|(position, y)| position[1] == *y) {
+            return Ok(());
+        }
+    }
+    let mut mesh = get_mesh_mut(entity, &geometries, &mut meshes)?;
+    match mesh.attribute_mut(Mesh::ATTRIBUTE_POSITION) {
+        Some(VertexAttributeValues::Float32x3(data)) => {
+            for (position, y) in data.iter_mut().zip(ys) {
+                position[1] = y;
+            }
+            Ok(())
+        }
+        Some(_) => Err(ProcessingError::InvalidArgument(
+            "Unexpected set_vertices_y format".into(),
+        )),
+        None => Err(ProcessingError::InvalidArgument(
+            "Geometry missing Mesh::ATTRIBUTE_POSITION".into(),
+        )),
+    }
+}
+
 #[derive(Clone, Debug)]
 pub enum AttributeValue {
     Float(f32),
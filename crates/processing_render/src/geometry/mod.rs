@@ -354,6 +354,102 @@ pub fn vertex(
     Ok(())
 }
 
+/// Replaces all vertex positions at once. Every other attribute in the layout is resized to
+/// match: new vertices take the geometry's current normal/color/uv (or the current value of a
+/// custom attribute), and surplus values are truncated.
+pub fn set_vertices(
+    In((entity, positions)): In<(Entity, Vec<[f32; 3]>)>,
+    geometries: Query<&Geometry>,
+    layouts: Query<&VertexLayout>,
+    attrs: Query<&Attribute>,
+    builtins: Res<BuiltinAttributes>,
+    mut meshes: ResMut<Assets<Mesh>>,
+) -> Result<()> {
+    let geometry = geometries
+        .get(entity)
+        .map_err(|_| ProcessingError::GeometryNotFound)?;
+
+    let layout = layouts
+        .get(geometry.layout)
+        .map_err(|_| ProcessingError::LayoutNotFound)?;
+
+    let count = positions.len();
+    // same positions and every attribute already sized to match: nothing would change, so don't
+    // mark the mesh modified
+    if let Some(mesh) = meshes.get(&geometry.handle)
+        && let Some(VertexAttributeValues::Float32x3(data)) =
+            mesh.attribute(Mesh::ATTRIBUTE_POSITION)
+        && *data == positions
+        && mesh.attributes().all(|(_, values)| values.len() == count)
+    {
+        return Ok(());
+    }
+
+    let mesh = meshes
+        .get_mut(&geometry.handle)
+        .map(|m| m.into_inner())
+        .ok_or(ProcessingError::GeometryNotFound)?;
+
+    mesh.insert_attribute(Mesh::ATTRIBUTE_POSITION, positions);
+
+    for &attr_entity in layout.attributes() {
+        if attr_entity == builtins.position {
+            continue;
+        }
+        let attr = attrs
+            .get(attr_entity)
+            .map_err(|_| ProcessingError::InvalidEntity)?;
+        let fill = if attr_entity == builtins.normal {
+            Some(AttributeValue::Float3(geometry.current_normal))
+        } else if attr_entity == builtins.color {
+            Some(AttributeValue::Float4(geometry.current_color))
+        } else if attr_entity == builtins.uv {
+            Some(AttributeValue::Float2(geometry.current_uv))
+        } else {
+            geometry.custom_current.get(&attr.inner.id).cloned()
+        };
+        if let Some(values) = mesh.attribute_mut(attr.inner) {
+            resize_values(values, count, fill.as_ref());
+        }
+    }
+
+    Ok(())
+}
+
+fn resize_values(values: &mut VertexAttributeValues, len: usize, fill: Option<&AttributeValue>) {
+    match values {
+        VertexAttributeValues::Float32(v) => {
+            let fill = match fill {
+                Some(AttributeValue::Float(f)) => *f,
+                _ => 0.0,
+            };
+            v.resize(len, fill);
+        }
+        VertexAttributeValues::Float32x2(v) => {
+            let fill = match fill {
+                Some(AttributeValue::Float2(f)) => *f,
+                _ => [0.0; 2],
+            };
+            v.resize(len, fill);
+        }
+        VertexAttributeValues::Float32x3(v) => {
+            let fill = match fill {
+                Some(AttributeValue::Float3(f)) => *f,
+                _ => [0.0; 3],
+            };
+            v.resize(len, fill);
+        }
+        VertexAttributeValues::Float32x4(v) => {
+            let fill = match fill {
+                Some(AttributeValue::Float4(f)) => *f,
+                _ => [0.0; 4],
+            };
+            v.resize(len, fill);
+        }
+        _ => {}
+    }
+}
+
 pub fn index(
     In((entity, i)): In<(Entity, u32)>,
     geometries: Query<&Geometry>,
@@ -383,6 +479,32 @@ pub fn index(
     Ok(())
 }
 
+/// Replaces the whole index buffer at once.
+pub fn set_indices(
+    In((entity, indices)): In<(Entity, Vec<u32>)>,
+    geometries: Query<&Geometry>,
+    mut meshes: ResMut<Assets<Mesh>>,
+) -> Result<()> {
+    let geometry = geometries
+        .get(entity)
+        .map_err(|_| ProcessingError::GeometryNotFound)?;
+
+    if let Some(Indices::U32(existing)) =
+        meshes.get(&geometry.handle).and_then(|mesh| mesh.indices())
+        && *existing == indices
+    {
+        return Ok(());
+    }
+
+    let mesh = meshes
+        .get_mut(&geometry.handle)
+        .map(|m| m.into_inner())
+        .ok_or(ProcessingError::GeometryNotFound)?;
+
+    mesh.insert_indices(Indices::U32(indices));
+    Ok(())
+}
+
 pub fn vertex_count(
     In(entity): In<Entity>,
     geometries: Query<&Geometry>,
@@ -425,3 +547,197 @@ pub fn destroy(
     commands.entity(entity).despawn();
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use bevy::ecs::message::Messages;
+
+    fn setup() -> (World, Entity, Entity) {
+        let mut world = World::new();
+        world.init_resource::<Assets<Mesh>>();
+        world.init_resource::<Messages<AssetEvent<Mesh>>>();
+        world.init_resource::<BuiltinAttributes>();
+
+        let weight = world
+            .spawn(Attribute::new("weight", AttributeFormat::Float))
+            .id();
+        let weight_inner = world.get::<Attribute>(weight).unwrap().inner.clone();
+        let builtins = world.resource::<BuiltinAttributes>();
+        let layout = VertexLayout::with_attributes(vec![
+            builtins.position,
+            builtins.normal,
+            builtins.color,
+            builtins.uv,
+            weight,
+        ]);
+        let layout = world.spawn(layout).id();
+
+        let mut mesh = Mesh::new(
+            PrimitiveTopology::TriangleList,
+            RenderAssetUsages::default(),
+        );
+        mesh.insert_attribute(Mesh::ATTRIBUTE_POSITION, Vec::<[f32; 3]>::new());
+        mesh.insert_attribute(Mesh::ATTRIBUTE_NORMAL, Vec::<[f32; 3]>::new());
+        mesh.insert_attribute(Mesh::ATTRIBUTE_COLOR, Vec::<[f32; 4]>::new());
+        mesh.insert_attribute(Mesh::ATTRIBUTE_UV_0, Vec::<[f32; 2]>::new());
+        mesh.insert_attribute(weight_inner, VertexAttributeValues::Float32(Vec::new()));
+        let handle = world.resource_mut::<Assets<Mesh>>().add(mesh);
+
+        let geometry = world.spawn(Geometry::new(handle, layout)).id();
+        (world, geometry, weight)
+    }
+
+    fn set(world: &mut World, geometry: Entity, positions: Vec<[f32; 3]>) {
+        world
+            .run_system_cached_with(set_vertices, (geometry, positions))
+            .unwrap()
+            .unwrap();
+    }
+
+    fn mesh_of(world: &World, geometry: Entity) -> &Mesh {
+        let handle = &world.get::<Geometry>(geometry).unwrap().handle;
+        world.resource::<Assets<Mesh>>().get(handle).unwrap()
+    }
+
+    /// Flushes the queued asset events and counts the `Modified` ones since the last call.
+    fn modified_count(world: &mut World) -> usize {
+        world
+            .run_system_cached(Assets::<Mesh>::asset_events)
+            .unwrap();
+        world
+            .resource_mut::<Messages<AssetEvent<Mesh>>>()
+            .drain()
+            .filter(|event| matches!(event, AssetEvent::Modified { .. }))
+            .count()
+    }
+
+    #[test]
+    fn test_set_vertices_fills_from_current_values() {
+        let (mut world, geometry, weight) = setup();
+        {
+            let mut geo = world.get_mut::<Geometry>(geometry).unwrap();
+            geo.current_normal = [0.0, 1.0, 0.0];
+            geo.current_color = [1.0, 0.0, 0.0, 1.0];
+            geo.current_uv = [0.5, 0.25];
+        }
+        set(&mut world, geometry, vec![[0.0; 3]; 3]);
+
+        let weight = world.get::<Attribute>(weight).unwrap().inner.clone();
+        let mesh = mesh_of(&world, geometry);
+        assert_eq!(mesh.count_vertices(), 3);
+        let Some(VertexAttributeValues::Float32x3(normals)) =
+            mesh.attribute(Mesh::ATTRIBUTE_NORMAL)
+        else {
+            panic!("missing normals");
+        };
+        assert_eq!(normals, &vec![[0.0, 1.0, 0.0]; 3]);
+        let Some(VertexAttributeValues::Float32x4(colors)) = mesh.attribute(Mesh::ATTRIBUTE_COLOR)
+        else {
+            panic!("missing colors");
+        };
+        assert_eq!(colors, &vec![[1.0, 0.0, 0.0, 1.0]; 3]);
+        let Some(VertexAttributeValues::Float32x2(uvs)) = mesh.attribute(Mesh::ATTRIBUTE_UV_0)
+        else {
+            panic!("missing uvs");
+        };
+        assert_eq!(uvs, &vec![[0.5, 0.25]; 3]);
+        // custom attributes without a current value are zero filled
+        let Some(VertexAttributeValues::Float32(weights)) = mesh.attribute(weight) else {
+            panic!("missing weights");
+        };
+        assert_eq!(weights, &vec![0.0; 3]);
+    }
+
+    #[test]
+    fn test_set_vertices_grows_and_shrinks() {
+        let (mut world, geometry, weight) = setup();
+        set(&mut world, geometry, vec![[0.0; 3]; 2]);
+
+        let weight = world.get::<Attribute>(weight).unwrap().inner.clone();
+        {
+            let mut geo = world.get_mut::<Geometry>(geometry).unwrap();
+            geo.current_color = [0.0, 0.0, 1.0, 1.0];
+            geo.custom_current
+                .insert(weight.id, AttributeValue::Float(2.0));
+        }
+        set(&mut world, geometry, vec![[1.0; 3]; 4]);
+
+        let mesh = mesh_of(&world, geometry);
+        assert_eq!(mesh.count_vertices(), 4);
+        // existing vertices keep their values, new ones take the current values
+        let Some(VertexAttributeValues::Float32x4(colors)) = mesh.attribute(Mesh::ATTRIBUTE_COLOR)
+        else {
+            panic!("missing colors");
+        };
+        assert_eq!(colors[..2], [[1.0; 4]; 2]);
+        assert_eq!(colors[2..], [[0.0, 0.0, 1.0, 1.0]; 2]);
+        let Some(VertexAttributeValues::Float32(weights)) = mesh.attribute(weight.clone()) else {
+            panic!("missing weights");
+        };
+        assert_eq!(weights, &vec![0.0, 0.0, 2.0, 2.0]);
+
+        set(&mut world, geometry, vec![[2.0; 3]]);
+        let mesh = mesh_of(&world, geometry);
+        assert_eq!(mesh.count_vertices(), 1);
+        for (_, values) in mesh.attributes() {
+            assert_eq!(values.len(), 1);
+        }
+    }
+
+    #[test]
+    fn test_unchanged_writes_do_not_modify_mesh() {
+        let (mut world, geometry, _) = setup();
+        set(&mut world, geometry, vec![[0.0; 3]; 3]);
+        world
+            .run_system_cached_with(set_indices, (geometry, vec![0, 1, 2]))
+            .unwrap()
+            .unwrap();
+        modified_count(&mut world);
+
+        set(&mut world, geometry, vec![[0.0; 3]; 3]);
+        world
+            .run_system_cached_with(set_indices, (geometry, vec![0, 1, 2]))
+            .unwrap()
+            .unwrap();
+        world
+            .run_system_cached_with(set_vertices_y, (geometry, vec![0.0; 3]))
+            .unwrap()
+            .unwrap();
+        world
+            .run_system_cached_with(set_colors, (geometry, vec![[1.0; 4]; 3]))
+            .unwrap()
+            .unwrap();
+        world
+            .run_system_cached_with(set_normal, (geometry, 1, Vec3::Z))
+            .unwrap()
+            .unwrap();
+        assert_eq!(modified_count(&mut world), 0);
+
+        // a real change still goes through
+        world
+            .run_system_cached_with(set_vertices_y, (geometry, vec![1.0; 3]))
+            .unwrap()
+            .unwrap();
+        assert_eq!(modified_count(&mut world), 1);
+        let Some(VertexAttributeValues::Float32x3(positions)) =
+            mesh_of(&world, geometry).attribute(Mesh::ATTRIBUTE_POSITION)
+        else {
+            panic!("missing positions");
+        };
+        assert_eq!(positions, &vec![[0.0, 1.0, 0.0]; 3]);
+    }
+
+    #[test]
+    fn test_set_vertices_y_length_mismatch() {
+        let (mut world, geometry, _) = setup();
+        set(&mut world, geometry, vec![[0.0; 3]; 3]);
+        modified_count(&mut world);
+
+        let result = world
+            .run_system_cached_with(set_vertices_y, (geometry, vec![1.0; 2]))
+            .unwrap();
+        assert!(matches!(result, Err(ProcessingError::InvalidArgument(_))));
+        assert_eq!(modified_count(&mut world), 0);
+    }
+}
@@ -1,6 +1,8 @@
 //! Load and query GLTF files, providing name-based lookup for meshes,
 //! materials, cameras, and lights.
 
+use std::collections::HashMap;
+
 use bevy::{
     asset::{
         AssetPath, LoadState, handle_internal_asset_events,
@@ -69,6 +71,8 @@ pub struct GltfHandle {
     handle: Handle<Gltf>,
     instance_id: bevy::world_serialization::InstanceId,
     graphics_entity: Entity,
+    /// geometries already resolved by [`geometry`], keyed by mesh name
+    geometries: HashMap<String, Entity>,
 }
 
 pub fn load(
@@ -123,6 +127,7 @@ pub fn load(
             handle,
             instance_id,
             graphics_entity,
+            geometries: HashMap::new(),
         })
         .id();
     Ok(entity)
@@ -135,6 +140,11 @@ pub fn geometry(
     let gltf_handle = world
         .get::<GltfHandle>(gltf_entity)
         .ok_or(ProcessingError::InvalidEntity)?;
+    if let Some(&entity) = gltf_handle.geometries.get(&name)
+        && world.get::<Geometry>(entity).is_some()
+    {
+        return Ok(entity);
+    }
     let instance_id = gltf_handle.instance_id;
 
     let (mesh_handle, global_transform) = {
@@ -179,6 +189,9 @@ pub fn geometry(
             GltfNodeTransform(global_transform),
         ))
         .id();
+    if let Some(mut gltf_handle) = world.get_mut::<GltfHandle>(gltf_entity) {
+        gltf_handle.geometries.insert(name, entity);
+    }
     Ok(entity)
 }
 
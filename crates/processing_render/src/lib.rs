@@ -43,11 +43,14 @@ pub struct ProcessingRenderPlugin;
 impl Plugin for ProcessingRenderPlugin {
     fn build(&self, app: &mut App) {
         use render::material::{add_custom_materials, add_processing_materials};
-        use render::{activate_cameras, clear_transient_meshes, flush_draw_commands};
+        use render::{
+            PrimitiveMeshes, activate_cameras, clear_transient_meshes, flush_draw_commands,
+        };
 
         let config = app.world().resource::<Config>().clone();
 
         app.init_resource::<time::ProcessingFrame>();
+        app.init_resource::<PrimitiveMeshes>();
 
         let has_sketch_file = config
             .get(ConfigKey::SketchFileName)
@@ -1383,6 +1386,54 @@ pub fn geometry_set_uv(entity: Entity, index: u32, uv: Vec2) -> error::Result<()
     })
 }
 
+pub fn geometry_set_vertices(entity: Entity, positions: Vec<[f32; 3]>) -> error::Result<()> {
+    app_mut(|app| {
+        app.world_mut()
+            .run_system_cached_with(geometry::set_vertices, (entity, positions))
+            .unwrap()
+    })
+}
+
+pub fn geometry_set_vertices_y(entity: Entity, ys: Vec<f32>) -> error::Result<()> {
+    app_mut(|app| {
+        app.world_mut()
+            .run_system_cached_with(geometry::set_vertices_y, (entity, ys))
+            .unwrap()
+    })
+}
+
+pub fn geometry_set_normals(entity: Entity, normals: Vec<[f32; 3]>) -> error::Result<()> {
+    app_mut(|app| {
+        app.world_mut()
+            .run_system_cached_with(geometry::set_normals, (entity, normals))
+            .unwrap()
+    })
+}
+
+pub fn geometry_set_colors(entity: Entity, colors: Vec<[f32; 4]>) -> error::Result<()> {
+    app_mut(|app| {
+        app.world_mut()
+            .run_system_cached_with(geometry::set_colors, (entity, colors))
+            .unwrap()
+    })
+}
+
+pub fn geometry_set_uvs(entity: Entity, uvs: Vec<[f32; 2]>) -> error::Result<()> {
+    app_mut(|app| {
+        app.world_mut()
+            .run_system_cached_with(geometry::set_uvs, (entity, uvs))
+            .unwrap()
+    })
+}
+
+pub fn geometry_set_indices(entity: Entity, indices: Vec<u32>) -> error::Result<()> {
+    app_mut(|app| {
+        app.world_mut()
+            .run_system_cached_with(geometry::set_indices, (entity, indices))
+            .unwrap()
+    })
+}
+
 pub fn geometry_get_attribute(
     geo_entity: Entity,
     attr_entity: Entity,
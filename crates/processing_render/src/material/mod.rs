@@ -85,6 +85,12 @@ pub fn set_property(
         .clone()
         .try_typed::<ExtendedMaterial<StandardMaterial, ProcessingMaterial>>()
     {
+        if extended_materials
+            .get(&handle)
+            .is_some_and(|m| pbr::is_unchanged(&m.base, &name, &value))
+        {
+            return Ok(());
+        }
         let mut extended = extended_materials
             .get_mut(&handle)
             .ok_or(ProcessingError::MaterialNotFound)?;
@@ -96,6 +102,12 @@ pub fn set_property(
         .clone()
         .try_typed::<crate::particles::material::ParticlesMaterial>()
     {
+        if particles_materials
+            .get(&handle)
+            .is_some_and(|m| pbr::is_unchanged(&m.base, &name, &value))
+        {
+            return Ok(());
+        }
         let mut extended = particles_materials
             .get_mut(&handle)
             .ok_or(ProcessingError::MaterialNotFound)?;
@@ -3,6 +3,25 @@ use bevy::prelude::*;
 use crate::shader_value::ShaderValue;
 use processing_core::error::{ProcessingError, Result};
 
+/// Whether `set_property` with these arguments would leave `material` as it is. Lets callers
+/// skip mutable asset access, which would otherwise re-prepare the material on the GPU.
+pub fn is_unchanged(material: &StandardMaterial, name: &str, value: &ShaderValue) -> bool {
+    match (name, value) {
+        ("base_color" | "color", ShaderValue::Float4(c)) => {
+            material.base_color == Color::srgba(c[0], c[1], c[2], c[3])
+        }
+        ("metallic", ShaderValue::Float(v)) => material.metallic == *v,
+        ("roughness" | "perceptual_roughness", ShaderValue::Float(v)) => {
+            material.perceptual_roughness == *v
+        }
+        ("reflectance", ShaderValue::Float(v)) => material.reflectance == *v,
+        ("emissive", ShaderValue::Float4(c)) => {
+            material.emissive == LinearRgba::new(c[0], c[1], c[2], c[3])
+        }
+        _ => false,
+    }
+}
+
 pub fn set_property(
     material: &mut StandardMaterial,
     name: &str,
@@ -101,3 +120,33 @@ pub fn set_property(
     }
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_is_unchanged_after_set_property() {
+        let cases = [
+            ("base_color", ShaderValue::Float4([0.1, 0.2, 0.3, 0.4])),
+            ("color", ShaderValue::Float4([0.5, 0.6, 0.7, 0.8])),
+            ("metallic", ShaderValue::Float(0.25)),
+            ("roughness", ShaderValue::Float(0.75)),
+            ("perceptual_roughness", ShaderValue::Float(0.35)),
+            ("reflectance", ShaderValue::Float(0.9)),
+            ("emissive", ShaderValue::Float4([1.0, 2.0, 3.0, 1.0])),
+        ];
+        for (name, value) in cases {
+            let mut material = StandardMaterial::default();
+            assert!(
+                !is_unchanged(&material, name, &value),
+                "'{name}' should differ from the default"
+            );
+            set_property(&mut material, name, &value, None).unwrap();
+            assert!(
+                is_unchanged(&material, name, &value),
+                "'{name}' should be unchanged after set_property"
+            );
+        }
+    }
+}
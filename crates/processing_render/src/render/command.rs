@@ -532,6 +532,14 @@ pub enum DrawCommand {
         angle: f32,
     },
     Geometry(Entity),
+    /// draws `geometry` once per transform, on top of the current matrix. instances share
+    /// the mesh and material, so they render as a single instanced draw, but each one is
+    /// still a per-frame entity. transforms must be affine translate/rotate/scale matrices;
+    /// shear and projective terms are dropped.
+    GeometryInstanced {
+        geometry: Entity,
+        transforms: Vec<Mat4>,
+    },
     Particles {
         particles: Entity,
         geometry: Entity,
@@ -4,6 +4,8 @@ pub mod mesh_builder;
 pub mod primitive;
 pub mod transform;
 
+use std::collections::HashMap;
+
 use bevy::{
     camera::{primitives::Aabb, visibility::RenderLayers},
     ecs::system::SystemParam,
@@ -54,6 +56,50 @@ pub struct RenderResources<'w, 's> {
     custom_materials: ResMut<'w, Assets<CustomMaterial>>,
     particles_materials: ResMut<'w, Assets<crate::particles::material::ParticlesMaterial>>,
     particle_buffers: Query<'w, 's, &'static crate::compute::Buffer>,
+    primitive_meshes: ResMut<'w, PrimitiveMeshes>,
+}
+
+/// Shape kind plus its parameters (floats as raw bits), used to look up a cached primitive mesh.
+#[derive(Clone, Copy, PartialEq, Eq, Hash)]
+enum PrimitiveKey {
+    Box([u32; 3]),
+    Sphere(u32, u32, u32),
+    Cylinder([u32; 2], u32),
+    Cone([u32; 2], u32),
+    Torus([u32; 2], [u32; 2]),
+    Plane([u32; 2]),
+    Capsule([u32; 2], u32),
+    ConicalFrustum([u32; 3], u32),
+    Tetrahedron(u32),
+}
+
+/// Upper bound on cached primitive meshes before the cache is dropped and rebuilt.
+const PRIMITIVE_MESH_CACHE_CAPACITY: usize = 256;
+
+/// Meshes for `box()`, `sphere()` and friends, shared across draws and frames so that an
+/// unchanged shape keeps its GPU buffers instead of being reallocated and uploaded every frame.
+#[derive(Resource, Default)]
+pub struct PrimitiveMeshes(HashMap<PrimitiveKey, Handle<Mesh>>);
+
+impl PrimitiveMeshes {
+    fn get_or_add(
+        &mut self,
+        key: PrimitiveKey,
+        meshes: &mut Assets<Mesh>,
+        build: impl FnOnce() -> Mesh,
+    ) -> Handle<Mesh> {
+        if let Some(handle) = self.0.get(&key) {
+            return handle.clone();
+        }
+        // sketches that animate shape parameters produce a fresh key every frame; spawned
+        // entities hold their own strong handles, so dropping the cache here is safe
+        if self.0.len() >= PRIMITIVE_MESH_CACHE_CAPACITY {
+            self.0.clear();
+        }
+        let handle = meshes.add(build());
+        self.0.insert(key, handle.clone());
+        handle
+    }
 }
 
 struct BatchState {
@@ -158,7 +204,7 @@ impl RenderState {
         self.blend_state = None;
         self.tint_color = None;
         self.image_mode = ShapeMode::Corner;
-        self.transform = TransformStack::new();
+        self.transform.clear();
         self.rect_mode = ShapeMode::Corner;
         self.ellipse_mode = ShapeMode::Center;
         self.shape_builder = None;
@@ -176,7 +222,7 @@ impl RenderState {
     }
 
     pub fn begin_frame(&mut self) {
-        self.transform = TransformStack::new();
+        self.transform.clear();
         self.shape_builder = None;
     }
 
@@ -943,48 +989,35 @@ pub fn flush_draw_commands(
                         continue;
                     };
 
-                    let material_key = material_key_with_fill(&state);
-                    let material_handle = match &material_key {
-                        MaterialKey::Custom {
-                            entity: mat_entity,
-                            blend_state,
-                        } => {
-                            let Some(untyped) = p_material_handles.get(*mat_entity).ok() else {
-                                warn!("Could not find material for entity {:?}", mat_entity);
-                                continue;
-                            };
-                            clone_custom_material_with_blend(
-                                &mut res.custom_materials,
-                                &untyped.0,
-                                *blend_state,
-                            )
-                        }
-                        _ => material_key.to_material(&mut res.materials),
+                    add_geometry(
+                        &mut res,
+                        &mut batch,
+                        &state,
+                        geometry,
+                        node_transform,
+                        &[Mat4::IDENTITY],
+                        &p_material_handles,
+                    );
+                }
+                DrawCommand::GeometryInstanced {
+                    geometry,
+                    transforms,
+                } => {
+                    let Some((geometry_data, node_transform)) = p_geometries.get(geometry).ok()
+                    else {
+                        warn!("Could not find Geometry for entity {:?}", geometry);
+                        continue;
                     };
 
-                    flush_batch(&mut res, &mut batch, &p_material_handles);
-
-                    let z_offset = -(batch.draw_index as f32 * BATCH_INDEX_STEP);
-                    let mut transform = state.transform.to_bevy_transform();
-
-                    // if the "source" geometry was parented in a gltf scene, we need to make sure that
-                    // we apply the parent transform here to ensure the correct final transform
-                    // TODO: think about how hierarchies should work, especially for retained
-                    if let Some(nt) = node_transform {
-                        transform =
-                            Transform::from_matrix(transform.to_matrix() * nt.0.to_matrix());
-                    }
-                    transform.translation.z += z_offset;
-
-                    res.commands.spawn((
-                        Mesh3d(geometry.handle.clone()),
-                        UntypedMaterial(material_handle),
-                        BelongsToGraphics(batch.graphics_entity),
-                        transform,
-                        batch.render_layers.clone(),
-                    ));
-
-                    batch.draw_index += 1;
+                    add_geometry(
+                        &mut res,
+                        &mut batch,
+                        &state,
+                        geometry_data,
+                        node_transform,
+                        &transforms,
+                        &p_material_handles,
+                    );
                 }
                 DrawCommand::Particles {
                     particles,
@@ -1085,7 +1118,8 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        box_mesh(width, height, depth),
+                        PrimitiveKey::Box([width.to_bits(), height.to_bits(), depth.to_bits()]),
+                        || box_mesh(width, height, depth),
                         &p_material_handles,
                     );
                 }
@@ -1098,7 +1132,8 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        sphere_mesh(radius, sectors, stacks),
+                        PrimitiveKey::Sphere(radius.to_bits(), sectors, stacks),
+                        || sphere_mesh(radius, sectors, stacks),
                         &p_material_handles,
                     );
                 }
@@ -1111,7 +1146,8 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        cylinder_mesh(radius, height, detail),
+                        PrimitiveKey::Cylinder([radius.to_bits(), height.to_bits()], detail),
+                        || cylinder_mesh(radius, height, detail),
                         &p_material_handles,
                     );
                 }
@@ -1124,7 +1160,8 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        cone_mesh(radius, height, detail),
+                        PrimitiveKey::Cone([radius.to_bits(), height.to_bits()], detail),
+                        || cone_mesh(radius, height, detail),
                         &p_material_handles,
                     );
                 }
@@ -1138,7 +1175,11 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        torus_mesh(radius, tube_radius, major_segments, minor_segments),
+                        PrimitiveKey::Torus(
+                            [radius.to_bits(), tube_radius.to_bits()],
+                            [major_segments, minor_segments],
+                        ),
+                        || torus_mesh(radius, tube_radius, major_segments, minor_segments),
                         &p_material_handles,
                     );
                 }
@@ -1147,7 +1188,8 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        plane_mesh(width, height),
+                        PrimitiveKey::Plane([width.to_bits(), height.to_bits()]),
+                        || plane_mesh(width, height),
                         &p_material_handles,
                     );
                 }
@@ -1160,7 +1202,8 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        capsule_mesh(radius, length, detail),
+                        PrimitiveKey::Capsule([radius.to_bits(), length.to_bits()], detail),
+                        || capsule_mesh(radius, length, detail),
                         &p_material_handles,
                     );
                 }
@@ -1174,7 +1217,15 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        conical_frustum_mesh(radius_top, radius_bottom, height, detail),
+                        PrimitiveKey::ConicalFrustum(
+                            [
+                                radius_top.to_bits(),
+                                radius_bottom.to_bits(),
+                                height.to_bits(),
+                            ],
+                            detail,
+                        ),
+                        || conical_frustum_mesh(radius_top, radius_bottom, height, detail),
                         &p_material_handles,
                     );
                 }
@@ -1183,7 +1234,8 @@ pub fn flush_draw_commands(
                         &mut res,
                         &mut batch,
                         &state,
-                        tetrahedron_mesh(radius),
+                        PrimitiveKey::Tetrahedron(radius.to_bits()),
+                        || tetrahedron_mesh(radius),
                         &p_material_handles,
                     );
                 }
@@ -1539,18 +1591,80 @@ fn flush_batch(
     batch.material_key = None;
 }
 
+/// Spawns one entity per instance transform. Every instance shares the geometry's mesh and a
+/// single material handle, which lets Bevy batch them into one instanced draw; the per-frame
+/// entity spawn still costs O(N) on the CPU. Instance matrices go through
+/// [`Transform::from_matrix`], so only affine translate/rotate/scale matrices are supported;
+/// shear and projective terms are dropped.
+fn add_geometry(
+    res: &mut RenderResources,
+    batch: &mut BatchState,
+    state: &RenderState,
+    geometry: &Geometry,
+    node_transform: Option<&GltfNodeTransform>,
+    instances: &[Mat4],
+    material_handles: &Query<&UntypedMaterial>,
+) {
+    let material_key = material_key_with_fill(state);
+    let material_handle = match &material_key {
+        MaterialKey::Custom {
+            entity: mat_entity,
+            blend_state,
+        } => {
+            let Some(untyped) = material_handles.get(*mat_entity).ok() else {
+                warn!("Could not find material for entity {:?}", mat_entity);
+                return;
+            };
+            clone_custom_material_with_blend(&mut res.custom_materials, &untyped.0, *blend_state)
+        }
+        _ => material_key.to_material(&mut res.materials),
+    };
+
+    flush_batch(res, batch, material_handles);
+
+    let z_offset = -(batch.draw_index as f32 * BATCH_INDEX_STEP);
+    let base = state.transform.to_bevy_transform();
+
+    for &instance in instances {
+        let mut transform = if instance == Mat4::IDENTITY {
+            base
+        } else {
+            Transform::from_matrix(base.to_matrix() * instance)
+        };
+
+        // if the "source" geometry was parented in a gltf scene, we need to make sure that
+        // we apply the parent transform here to ensure the correct final transform
+        // TODO: think about how hierarchies should work, especially for retained
+        if let Some(nt) = node_transform {
+            transform = Transform::from_matrix(transform.to_matrix() * nt.0.to_matrix());
+        }
+        transform.translation.z += z_offset;
+
+        res.commands.spawn((
+            Mesh3d(geometry.handle.clone()),
+            UntypedMaterial(material_handle.clone()),
+            BelongsToGraphics(batch.graphics_entity),
+            transform,
+            batch.render_layers.clone(),
+        ));
+    }
+
+    batch.draw_index += 1;
+}
+
 fn add_shape3d(
     res: &mut RenderResources,
     batch: &mut BatchState,
     state: &RenderState,
-    mesh: Mesh,
+    key: PrimitiveKey,
+    build: impl FnOnce() -> Mesh,
     material_handles: &Query<&UntypedMaterial>,
 ) {
     use bevy::pbr::wireframe::{Wireframe, WireframeColor, WireframeLineWidth, WireframeTopology};
 
     flush_batch(res, batch, material_handles);
 
-    let mesh_handle = res.meshes.add(mesh);
+    let mesh_handle = res.primitive_meshes.get_or_add(key, &mut res.meshes, build);
     let fill_color = state.fill_color.unwrap_or(Color::WHITE);
     let material_handle = match &state.material_key {
         MaterialKey::Custom { entity, .. } => {
@@ -1669,3 +1783,32 @@ fn create_ndc_background_quad(world_from_clip: Mat4, color: Color, with_uvs: boo
 
     mesh
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_primitive_meshes_reuse_and_clear_when_full() {
+        let mut meshes = Assets::<Mesh>::default();
+        let mut cache = PrimitiveMeshes::default();
+        let capacity = PRIMITIVE_MESH_CACHE_CAPACITY as u32;
+
+        let first = cache.get_or_add(PrimitiveKey::Tetrahedron(0), &mut meshes, empty_mesh);
+        let again = cache.get_or_add(PrimitiveKey::Tetrahedron(0), &mut meshes, || -> Mesh {
+            unreachable!("cached meshes should not be rebuilt")
+        });
+        assert_eq!(first, again);
+
+        for i in 1..capacity {
+            cache.get_or_add(PrimitiveKey::Tetrahedron(i), &mut meshes, empty_mesh);
+        }
+        assert_eq!(cache.0.len(), PRIMITIVE_MESH_CACHE_CAPACITY);
+
+        // one more key drops every cached mesh and starts over with just the new one
+        cache.get_or_add(PrimitiveKey::Tetrahedron(capacity), &mut meshes, empty_mesh);
+        assert_eq!(cache.0.len(), 1);
+        let rebuilt = cache.get_or_add(PrimitiveKey::Tetrahedron(0), &mut meshes, empty_mesh);
+        assert_ne!(first, rebuilt);
+    }
+}
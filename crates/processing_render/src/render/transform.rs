@@ -1,14 +1,26 @@
 use bevy::math::{Affine3A, Mat3, Quat, Vec3};
 
-#[derive(Debug, Clone, Default)]
+/// Nesting depth the stack is preallocated for, so typical push/pop pairs never allocate.
+const STACK_CAPACITY: usize = 64;
+
+#[derive(Debug, Clone)]
 pub struct TransformStack {
     current: Affine3A,
     stack: Vec<Affine3A>,
 }
 
+impl Default for TransformStack {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
 impl TransformStack {
     pub fn new() -> Self {
-        Self::default()
+        Self {
+            current: Affine3A::IDENTITY,
+            stack: Vec::with_capacity(STACK_CAPACITY),
+        }
     }
 
     pub fn current(&self) -> Affine3A {
@@ -133,6 +145,19 @@ mod tests {
         (a - b).abs() < EPSILON
     }
 
+    #[test]
+    fn test_clear_keeps_capacity() {
+        let mut stack = TransformStack::new();
+        for _ in 0..STACK_CAPACITY {
+            stack.push();
+        }
+        stack.translate(1.0, 2.0);
+        stack.clear();
+        assert_eq!(stack.current(), Affine3A::IDENTITY);
+        assert!(stack.stack.is_empty());
+        assert!(stack.stack.capacity() >= STACK_CAPACITY);
+    }
+
     #[test]
     fn test_identity() {
         let stack = TransformStack::new();
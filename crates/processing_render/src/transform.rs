@@ -9,7 +9,11 @@ pub fn set_position(
     let mut transform = transforms
         .get_mut(entity)
         .map_err(|_| ProcessingError::TransformNotFound)?;
-    transform.translation = position;
+    // sketches commonly set the camera every frame; only trigger change detection (and the
+    // transform propagation that follows) when the value actually changes
+    if transform.translation != position {
+        transform.translation = position;
+    }
     Ok(())
 }
 
@@ -108,7 +112,8 @@ pub fn look_at(
     let mut transform = transforms
         .get_mut(entity)
         .map_err(|_| ProcessingError::TransformNotFound)?;
-    transform.look_at(target, Vec3::Y);
+    let looking_at = transform.looking_at(target, Vec3::Y);
+    transform.set_if_neq(looking_at);
     Ok(())
 }
 
@@ -1,6 +1,6 @@
 use processing_glfw::GlfwContext;
 
-use bevy::math::{Vec3, Vec4};
+use bevy::math::Vec3;
 use processing::prelude::*;
 use processing_render::geometry::Topology;
 use processing_render::render::command::DrawCommand;
@@ -33,40 +33,40 @@ fn sketch() -> error::Result<()> {
 
     let mesh = geometry_create(Topology::TriangleList)?;
 
+    let vertex_count = (grid_size * grid_size) as usize;
+    let mut positions = Vec::with_capacity(vertex_count);
+    let mut colors = Vec::with_capacity(vertex_count);
+    let mut indices = Vec::with_capacity(6 * (grid_size as usize - 1).pow(2));
     for z in 0..grid_size {
         for x in 0..grid_size {
             let px = x as f32 * spacing - offset;
             let pz = z as f32 * spacing - offset;
-            geometry_color(
-                mesh,
-                Vec4::new(
-                    x as f32 / grid_size as f32,
-                    0.5,
-                    z as f32 / grid_size as f32,
-                    1.0,
-                ),
-            )?;
-            geometry_normal(mesh, Vec3::new(0.0, 1.0, 0.0))?;
-            geometry_vertex(mesh, Vec3::new(px, 0.0, pz))?;
+            positions.push([px, 0.0, pz]);
+            colors.push([
+                x as f32 / grid_size as f32,
+                0.5,
+                z as f32 / grid_size as f32,
+                1.0,
+            ]);
+
+            // the quad rooted at (x, z), except along the far edges
+            if z < grid_size - 1 && x < grid_size - 1 {
+                let tl = z * grid_size + x;
+                let tr = tl + 1;
+                let bl = (z + 1) * grid_size + x;
+                let br = bl + 1;
+
+                indices.extend_from_slice(&[tl, bl, tr, tr, bl, br]);
+            }
         }
     }
+    // x/z never change, only the height does
+    let xz: Vec<(f32, f32)> = positions.iter().map(|&[px, _, pz]| (px, pz)).collect();
 
-    for z in 0..(grid_size - 1) {
-        for x in 0..(grid_size - 1) {
-            let tl = z * grid_size + x;
-            let tr = tl + 1;
-            let bl = (z + 1) * grid_size + x;
-            let br = bl + 1;
-
-            geometry_index(mesh, tl)?;
-            geometry_index(mesh, bl)?;
-            geometry_index(mesh, tr)?;
-
-            geometry_index(mesh, tr)?;
-            geometry_index(mesh, bl)?;
-            geometry_index(mesh, br)?;
-        }
-    }
+    geometry_normal(mesh, Vec3::new(0.0, 1.0, 0.0))?;
+    geometry_set_vertices(mesh, positions)?;
+    geometry_set_colors(mesh, colors)?;
+    geometry_set_indices(mesh, indices)?;
 
     graphics_mode_3d(graphics)?;
     transform_set_position(graphics, Vec3::new(150.0, 150.0, 150.0))?;
@@ -75,15 +75,11 @@ fn sketch() -> error::Result<()> {
     let mut time = 0.0f32;
 
     while glfw_ctx.poll_events() {
-        for z in 0..grid_size {
-            for x in 0..grid_size {
-                let idx = z * grid_size + x;
-                let px = x as f32 * spacing - offset;
-                let pz = z as f32 * spacing - offset;
-                let wave = (px * 0.1 + time).sin() * (pz * 0.1 + time).cos() * 20.0;
-                geometry_set_vertex(mesh, idx, Vec3::new(px, wave, pz))?;
-            }
-        }
+        let ys = xz
+            .iter()
+            .map(|&(px, pz)| (px * 0.1 + time).sin() * (pz * 0.1 + time).cos() * 20.0)
+            .collect();
+        geometry_set_vertices_y(mesh, ys)?;
 
         graphics_begin_draw(graphics)?;
         graphics_record_command(